@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+import json
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TARGET_DIRS = ('src', 'shaders')
+EXTENSIONS = ('.c', '.h', '.frag', '.vert', '.glsl')
+SENTINELS = (b'/', b'"', b"'")
+MMAP_MIN_SIZE = 1 << 20
+CACHE_PATH = os.path.join(ROOT_DIR, '.remove_comments_cache.json')
+
+
+def remove_line_comments(content):
+    lines = content.split(b'\n')
+    for idx, line in enumerate(lines):
+        k = line.find(b'//')
+        if k != -1:
+            lines[idx] = line[:k]
+    return b'\n'.join(lines)
+
+
+def remove_comments(content):
+    if b'/*' not in content and b'"' not in content and b"'" not in content:
+        return remove_line_comments(content)
+    out = []
+    append = out.append
+    i = 0
+    n = len(content)
+    nexts = [content.find(ch) for ch in SENTINELS]
+    while i < n:
+        nxt = n
+        for s, ch in enumerate(SENTINELS):
+            k = nexts[s]
+            if k != -1 and k < i:
+                k = content.find(ch, i)
+                nexts[s] = k
+            if k != -1 and k < nxt:
+                nxt = k
+        if nxt == n:
+            append(content[i:])
+            break
+        ch = content[nxt:nxt + 1]
+        if ch == b'/':
+            follow = content[nxt + 1:nxt + 2]
+            if follow == b'/':
+                append(content[i:nxt])
+                end = content.find(b'\n', nxt + 2)
+                i = n if end == -1 else end
+            elif follow == b'*':
+                append(content[i:nxt])
+                end = content.find(b'*/', nxt + 2)
+                if end == -1:
+                    i = n
+                else:
+                    append(b'\n' * content.count(b'\n', nxt + 2, end))
+                    i = end + 2
+            else:
+                append(content[i:nxt + 1])
+                i = nxt + 1
+        else:
+            j = nxt + 1
+            while j < n:
+                c = content[j:j + 1]
+                if c == b'\\':
+                    j += 2
+                    continue
+                if c == ch or c == b'\n':
+                    break
+                j += 1
+            j = min(j, n - 1)
+            append(content[i:j + 1])
+            i = j + 1
+    return b''.join(out)
+
+
+def process_file(filepath):
+    try:
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b'/') == -1:
+                        return False
+                    data = bytes(mm)
+            else:
+                data = f.read()
+                if b'/' not in data:
+                    return False
+        new = remove_comments(data)
+        if new == data:
+            return False
+        tmp = filepath + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(new)
+        os.replace(tmp, filepath)
+        return True
+    except OSError:
+        return None
+
+
+def walk(root):
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(EXTENSIONS):
+                    yield entry
+
+
+def collect_entries():
+    entries = []
+    for target in TARGET_DIRS:
+        entries.extend(walk(os.path.join(ROOT_DIR, target)))
+    return entries
+
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    tmp = CACHE_PATH + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+    os.replace(tmp, CACHE_PATH)
+
+
+def file_signature(st):
+    return [st.st_mtime_ns, st.st_size]
+
+
+def main():
+    quiet = '--quiet' in sys.argv
+    cache = load_cache()
+    pending = []
+    for entry in collect_entries():
+        rel = os.path.relpath(entry.path, ROOT_DIR)
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        if cache.get(rel) == file_signature(st):
+            continue
+        pending.append((entry.path, rel))
+    changed = 0
+    paths = [filepath for filepath, _rel in pending]
+    with ProcessPoolExecutor() as ex:
+        for (filepath, rel), result in zip(pending, ex.map(process_file, paths, chunksize=32)):
+            if result is None:
+                cache.pop(rel, None)
+                continue
+            try:
+                cache[rel] = file_signature(os.stat(filepath))
+            except OSError:
+                cache.pop(rel, None)
+                continue
+            if result:
+                changed += 1
+                if not quiet:
+                    print(f'Cleaned: {rel}')
+    save_cache(cache)
+    if not quiet:
+        print(f'Done. Files changed: {changed}')
+
+
+if __name__ == '__main__':
+    main()